@@ -5,6 +5,12 @@ from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+# Root of the CreatureStudio project (the directory that contains
+# ``backend/``, ``frontend/``, ``shared/``, ``docs/``, and ``exports/``).
+# Resolved once at import so Settings defaults do not hit the filesystem.
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
 class Settings(BaseSettings):
     """Application settings for CreatureStudio.
 
@@ -16,45 +22,33 @@ class Settings(BaseSettings):
 
     app_name: str = "CreatureStudio"
 
-    # Root of the CreatureStudio project (the directory that contains
-    # ``backend/``, ``frontend/``, ``shared/``, ``docs/``, and ``exports/``).
-    base_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2]
-    )
+    # Serve the interactive API docs (/docs, /redoc) and /openapi.json. Set
+    # CREATURESTUDIO_API_DOCS=0 for CI or bundled builds to skip building the
+    # OpenAPI schema entirely.
+    api_docs: bool = True
 
-    backend_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2] / "backend"
-    )
-    frontend_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2] / "frontend"
-    )
-    shared_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2] / "shared"
-    )
+    # Root of the CreatureStudio project.
+    base_dir: Path = Field(default_factory=lambda: _PROJECT_ROOT)
+
+    backend_dir: Path = Field(default_factory=lambda: _PROJECT_ROOT / "backend")
+    frontend_dir: Path = Field(default_factory=lambda: _PROJECT_ROOT / "frontend")
+    shared_dir: Path = Field(default_factory=lambda: _PROJECT_ROOT / "shared")
 
     # Where template JSON blueprints (quadruped, biped, etc.) live.
     templates_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2]
-        / "shared"
-        / "templates"
+        default_factory=lambda: _PROJECT_ROOT / "shared" / "templates"
     )
 
     # Where blueprint JSON / schemas will eventually live.
     blueprints_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2]
-        / "shared"
-        / "blueprints"
+        default_factory=lambda: _PROJECT_ROOT / "shared" / "blueprints"
     )
 
     # Where export artifacts (saved animals, images, etc.) should be written.
-    exports_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2] / "exports"
-    )
+    exports_dir: Path = Field(default_factory=lambda: _PROJECT_ROOT / "exports")
 
     # Where markdown documentation (including the animalrulebook) lives.
-    docs_dir: Path = Field(
-        default_factory=lambda: Path(__file__).resolve().parents[2] / "docs"
-    )
+    docs_dir: Path = Field(default_factory=lambda: _PROJECT_ROOT / "docs")
 
     class Config:
         env_prefix = "CREATURESTUDIO_"
@@ -1,9 +1,19 @@
-from fastapi import FastAPI
+from typing import Any
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
+from .responses import ORJSONResponse
 from .routers.blueprints import router as blueprints_router
 from .routers.export import router as export_router
+from .services.blueprint_store import (
+    BlueprintError,
+    BlueprintNotFoundError,
+    BlueprintTooLargeError,
+    BlueprintValidationError,
+    ProtectedBlueprintError,
+)
 
 
 settings = get_settings()
@@ -12,6 +22,10 @@ app = FastAPI(
     title="CreatureStudio API",
     version="0.1.0",
     description="Backend API for CreatureStudio foundation (Phase 0-3).",
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if settings.api_docs else None,
+    redoc_url="/redoc" if settings.api_docs else None,
+    openapi_url="/openapi.json" if settings.api_docs else None,
 )
 
 # Allow the Vite dev server by default.
@@ -28,6 +42,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Status codes for blueprint store errors that a route does not map itself.
+# Order matters: the first matching class wins, so subclasses come first.
+_BLUEPRINT_ERROR_STATUS = (
+    (BlueprintNotFoundError, 404),
+    (ProtectedBlueprintError, 409),
+    (BlueprintTooLargeError, 413),
+    (BlueprintValidationError, 422),
+)
+
+
+@app.exception_handler(BlueprintError)
+async def blueprint_error_handler(
+    request: Request, exc: BlueprintError
+) -> ORJSONResponse:
+    """Translate an unhandled :class:`BlueprintError` into a JSON error."""
+    status_code = next(
+        (code for cls, code in _BLUEPRINT_ERROR_STATUS if isinstance(exc, cls)),
+        500,
+    )
+    detail: Any = str(exc)
+    if status_code == 422:
+        detail = {"message": str(exc), "details": exc.details}
+    return ORJSONResponse(status_code=status_code, content={"detail": detail})
+
+
 # Register routers.
 app.include_router(blueprints_router)
 app.include_router(export_router)
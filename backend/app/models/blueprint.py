@@ -7,7 +7,10 @@ types in frontend/src/types/SpeciesBlueprint.ts.
 
 from typing import Dict, List, Optional, Any, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# The larger composite models below set ``defer_build=True`` so their core
+# schemas are built on first use rather than at import time.
 
 
 class BlueprintMeta(BaseModel):
@@ -42,6 +45,13 @@ class BodyPlan(BaseModel):
 class Bone(BaseModel):
     """Single bone in the control skeleton."""
 
+    # Nothing edits bones in place, so field assignment on a Bone is
+    # rejected. It is not deep immutability: ``position`` is still a plain
+    # list (so bones are not hashable either) and the enclosing models stay
+    # mutable, so shared cached blueprints remain read-only by convention
+    # (see ``load_blueprint_shared``).
+    model_config = ConfigDict(frozen=True)
+
     name: str
     parent: str
     position: List[float] = Field(
@@ -54,6 +64,8 @@ class Bone(BaseModel):
 class Skeleton(BaseModel):
     """Control skeleton for a species blueprint."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: Optional[str] = None
     coordinateSystem: Optional[str] = None
     bones: List[Bone]
@@ -62,6 +74,8 @@ class Skeleton(BaseModel):
 class Chains(BaseModel):
     """Named anatomical chains mapping to ordered lists of bone names."""
 
+    model_config = ConfigDict(defer_build=True)
+
     spine: List[str] = Field(default_factory=list)
     neck: List[str] = Field(default_factory=list)
     head: List[str] = Field(default_factory=list)
@@ -273,6 +287,8 @@ class BodyPartRef(BaseModel):
 class BodyPartsConfig(BaseModel):
     """Mapping from body part names to generator configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     torso: Optional[BodyPartRef] = None
     neck: Optional[BodyPartRef] = None
     head: Optional[BodyPartRef] = None
@@ -303,6 +319,8 @@ class MaterialDefinition(BaseModel):
 class MaterialsConfig(BaseModel):
     """Material configuration for an animal."""
 
+    model_config = ConfigDict(defer_build=True)
+
     surface: Optional[MaterialDefinition] = None
     eye: Optional[MaterialDefinition] = None
     tusk: Optional[MaterialDefinition] = None
@@ -325,6 +343,8 @@ class BehaviorPresets(BaseModel):
 class SpeciesBlueprint(BaseModel):
     """Top-level species blueprint model used for validation and tooling."""
 
+    model_config = ConfigDict(defer_build=True)
+
     meta: BlueprintMeta
     bodyPlan: BodyPlan
     skeleton: Skeleton
@@ -0,0 +1,26 @@
+"""Response classes shared by the CreatureStudio API."""
+
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with ``orjson`` instead of the stdlib encoder.
+
+    This mirrors ``fastapi.responses.ORJSONResponse``, which newer FastAPI
+    releases deprecate, so the app behaves the same across the FastAPI
+    versions allowed by ``requirements.txt``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header value matches *etag*."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-from typing import List
-from pydantic import BaseModel
-
-from fastapi import APIRouter, HTTPException, UploadFile, File, status
+from typing import Any, List
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from fastapi import (
+    APIRouter,
+    File,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 
 from app.models.blueprint import BlueprintMeta, SpeciesBlueprint
+from app.responses import etag_matches
 from app.services.blueprint_store import (
+    MAX_IMPORT_BYTES,
     BlueprintNotFoundError,
+    BlueprintTooLargeError,
     BlueprintValidationError,
     ProtectedBlueprintError,
+    blueprint_etag,
     list_blueprints,
     load_blueprint,
     save_blueprint,
@@ -23,14 +37,28 @@ from app.services.blueprint_store import (
 
 router = APIRouter(prefix="/api/blueprints", tags=["blueprints"])
 
+# Responses are serialized through these shared adapters rather than via
+# ``response_model=``, which would make FastAPI build (and clone) a separate
+# response field for every route. ``responses=`` keeps the OpenAPI schema.
+_BLUEPRINT_ADAPTER: TypeAdapter[SpeciesBlueprint] = TypeAdapter(SpeciesBlueprint)
+_BLUEPRINT_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"model": SpeciesBlueprint}
+}
+
+
+def _json_response(adapter: TypeAdapter[Any], value: Any) -> Response:
+    """Serialize *value* with *adapter* straight to a JSON response."""
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+
 class NewBlueprintRequest(BaseModel):
     """Payload for creating a new species from a built-in template."""
     name: str
     templateType: str
 
 
-@router.post("", response_model=SpeciesBlueprint)
-def create_blueprint(request: NewBlueprintRequest) -> SpeciesBlueprint:
+@router.post("", responses=_BLUEPRINT_RESPONSES)
+def create_blueprint(request: NewBlueprintRequest) -> Response:
     """Create a new blueprint on disk from a template.
 
     This is the main entry point for the "New from Template" UI action.
@@ -40,18 +68,23 @@ def create_blueprint(request: NewBlueprintRequest) -> SpeciesBlueprint:
             name=request.name,
             template_type=request.templateType,
         )
-        return blueprint
+        return _json_response(_BLUEPRINT_ADAPTER, blueprint)
     except ProtectedBlueprintError as exc:
         # 409: conflict with a protected name (e.g., "Elephant").
         raise HTTPException(status_code=409, detail=str(exc)) from exc
     except BlueprintValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # pragma: no cover - defensive
-        raise HTTPException(status_code=500, detail="Failed to create blueprint from template") from exc
+    except BlueprintNotFoundError as exc:
+        # A template file missing from the install is a server fault, not a
+        # missing resource the client asked for, so it stays a 500 rather
+        # than the app-wide 404 mapping.
+        raise HTTPException(
+            status_code=500, detail="Failed to create blueprint from template"
+        ) from exc
 
 
-@router.post("/import", response_model=SpeciesBlueprint)
-async def import_blueprint(file: UploadFile | None = File(None)) -> SpeciesBlueprint:
+@router.post("/import", responses=_BLUEPRINT_RESPONSES)
+async def import_blueprint(file: UploadFile | None = File(None)) -> Response:
     """Import a blueprint JSON file and persist it on disk.
 
     The uploaded file should contain a SpeciesBlueprint JSON document. The
@@ -60,16 +93,26 @@ async def import_blueprint(file: UploadFile | None = File(None)) -> SpeciesBluep
     if not file:
         raise HTTPException(status_code=400, detail="No file uploaded")
 
+    if file.size is not None and file.size > MAX_IMPORT_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Import payload exceeds the {MAX_IMPORT_BYTES} byte limit",
+        )
+
     try:
-        content = await file.read()
-        blueprint = import_blueprint_from_bytes(content)
-        return blueprint
+        # Read at most one byte past the limit; the service rejects anything
+        # longer without us buffering the whole upload.
+        content = await file.read(MAX_IMPORT_BYTES + 1)
+        # Validation and the file write are blocking; keep them off the
+        # event loop so concurrent requests are not stalled.
+        blueprint = await run_in_threadpool(import_blueprint_from_bytes, content)
+        return _json_response(_BLUEPRINT_ADAPTER, blueprint)
     except ProtectedBlueprintError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except BlueprintTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc)) from exc
     except BlueprintValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # pragma: no cover - defensive
-        raise HTTPException(status_code=500, detail="Failed to import blueprint") from exc
 
 
 
@@ -85,71 +128,111 @@ class BlueprintListItem(BlueprintMeta):
     pass
 
 
+_LIST_ADAPTER: TypeAdapter[List[BlueprintListItem]] = TypeAdapter(
+    List[BlueprintListItem]
+)
+
+
 @router.get(
     "",
-    response_model=List[BlueprintListItem],
+    responses={200: {"model": List[BlueprintListItem]}},
     status_code=status.HTTP_200_OK,
     summary="List available species blueprints",
 )
-def get_blueprints() -> List[BlueprintListItem]:
-    """Return metadata for all available blueprints."""
-    metas = list_blueprints()
-    # They are already BlueprintMeta instances; we can return them directly
-    # thanks to BlueprintListItem inheriting from BlueprintMeta.
-    return [BlueprintListItem(**m.dict()) for m in metas]
+def get_blueprints() -> Response:
+    """Return metadata for all available blueprints.
+
+    One unreadable file in the blueprints directory is a server-side fault,
+    not something wrong with the request, so it is reported as a 500 rather
+    than through the app-level 422 mapping.
+    """
+    try:
+        metas = list_blueprints()
+    except BlueprintValidationError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    # They are already validated BlueprintMeta instances, and BlueprintListItem
+    # adds no fields, so re-wrap them without running validation again.
+    items = [BlueprintListItem.model_construct(**vars(m)) for m in metas]
+    return _json_response(_LIST_ADAPTER, items)
 
 
 @router.get(
     "/{name}",
-    response_model=SpeciesBlueprint,
+    responses=_BLUEPRINT_RESPONSES,
     status_code=status.HTTP_200_OK,
     summary="Get a specific species blueprint",
 )
-def get_blueprint(name: str) -> SpeciesBlueprint:
-    """Return the full :class:`SpeciesBlueprint` for *name*."""
-    try:
-        return load_blueprint(name)
-    except BlueprintNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
-        ) from exc
-    except BlueprintValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"message": str(exc), "details": exc.details},
-        ) from exc
+def get_blueprint(name: str, request: Request) -> Response:
+    """Return the full :class:`SpeciesBlueprint` for *name*.
+
+    Responses carry an ``ETag``; a request whose ``If-None-Match`` still
+    matches gets an empty ``304 Not Modified`` without the file being read.
+    Missing (404) and invalid (422) blueprints are mapped by the app-level
+    ``BlueprintError`` handler.
+    """
+    etag = blueprint_etag(name)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    blueprint = load_blueprint(name)
+    response = _json_response(_BLUEPRINT_ADAPTER, blueprint)
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.put(
     "/{name}",
-    response_model=SpeciesBlueprint,
+    responses=_BLUEPRINT_RESPONSES,
     status_code=status.HTTP_200_OK,
     summary="Create or update a species blueprint",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/SpeciesBlueprint"}
+                }
+            },
+        }
+    },
 )
-def put_blueprint(name: str, blueprint: SpeciesBlueprint) -> SpeciesBlueprint:
+async def put_blueprint(name: str, request: Request) -> Response:
     """Create or update a blueprint.
 
     The blueprint is validated as a :class:`SpeciesBlueprint`. If the
     path parameter *name* does not match ``blueprint.meta.name``, the
     latter is overwritten to keep things consistent on disk.
+
+    The raw body is handed to ``validate_json`` so JSON parsing and model
+    validation happen in a single pydantic-core pass; errors are reported
+    in FastAPI's usual 422 shape.
     """
+    body = await request.body()
+    try:
+        blueprint = _BLUEPRINT_ADAPTER.validate_json(body)
+    except ValidationError as exc:
+        # Prefix each location with "body" so the 422 payload matches what
+        # FastAPI's own body validation used to report. The offending input
+        # is left out: for a top-level error it is the whole request body.
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False, include_input=False)
+            ]
+        ) from exc
+
     # Ensure the meta.name matches the requested logical name.
     if blueprint.meta.name != name:
-        meta = blueprint.meta.copy(update={"name": name})
-        blueprint = blueprint.copy(update={"meta": meta})
+        meta = blueprint.meta.model_copy(update={"name": name})
+        blueprint = blueprint.model_copy(update={"meta": meta})
 
-    try:
-        save_blueprint(name, blueprint)
-    except BlueprintValidationError as exc:
-        # This is unlikely here because validation already occurred, but we keep
-        # the error mapping explicit.
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"message": str(exc), "details": exc.details},
-        ) from exc
+    await run_in_threadpool(save_blueprint, name, blueprint)
 
-    # Re-load to ensure round-trip correctness.
-    return load_blueprint(name)
+    # The body was validated above with validate_json and is exactly what
+    # was just written, so there is no need to re-read it from disk.
+    return _json_response(_BLUEPRINT_ADAPTER, blueprint)
 
 
 @router.delete(
@@ -160,7 +243,8 @@ def put_blueprint(name: str, blueprint: SpeciesBlueprint) -> SpeciesBlueprint:
 def delete_blueprint_endpoint(name: str) -> dict:
     """Delete a blueprint unless it is protected.
 
-    On success this returns HTTP 200 with a small JSON body.
+    On success this returns HTTP 200 with a small JSON body. Protected
+    names are rejected with HTTP 400 here rather than the app-wide 409.
     """
     try:
         delete_blueprint(name)
@@ -168,9 +252,5 @@ def delete_blueprint_endpoint(name: str) -> dict:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
-    except BlueprintNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
-        ) from exc
 
     return {"status": "deleted", "name": name}
@@ -2,23 +2,24 @@
 
 from __future__ import annotations
 
+import stat
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
 from app.config import get_settings
-from app.services.blueprint_store import (
-    BlueprintNotFoundError,
-    BlueprintValidationError,
-    load_blueprint,
-)
+from app.responses import etag_matches
+from app.services.blueprint_store import load_blueprint_shared
 from app.services.export_service import export_animal
 
 
 router = APIRouter(prefix="/api/export", tags=["export"])
 
+_DOWNLOAD_CACHE_CONTROL = "no-cache"
+
 
 class ExportRequest(BaseModel):
     """Request body model for the export endpoint."""
@@ -45,19 +46,14 @@ async def export_blueprint(name: str, body: ExportRequest) -> Dict[str, Any]:
             detail="Missing or invalid 'version' in request body.",
         )
 
-    try:
-        blueprint = load_blueprint(name)
-    except BlueprintNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
-        ) from exc
-    except BlueprintValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"message": str(exc), "details": exc.details},
-        ) from exc
+    # Loading and zipping are blocking file I/O; run them in the threadpool
+    # so this async endpoint does not stall the event loop. Missing (404) and
+    # invalid (422) blueprints are mapped by the app-level BlueprintError
+    # handler. Exporting only reads the blueprint, so the shared validated
+    # instance is reused while the file is unchanged.
+    blueprint = await run_in_threadpool(load_blueprint_shared, name)
 
-    zip_path = export_animal(blueprint, version)
+    zip_path = await run_in_threadpool(export_animal, blueprint, version)
 
     filename = zip_path.name
     download_path = f"/api/export/download/{filename}"
@@ -73,8 +69,13 @@ async def export_blueprint(name: str, body: ExportRequest) -> Dict[str, Any]:
     "/download/{filename}",
     summary="Download an exported animal zip",
 )
-async def download_export(filename: str) -> FileResponse:
-    """Stream an exported zip file to the client."""
+async def download_export(filename: str, request: Request) -> Response:
+    """Stream an exported zip file to the client.
+
+    Re-exporting a version overwrites its zip under the same name, so
+    clients may cache downloads but must revalidate them; a matching
+    ``If-None-Match`` gets an empty ``304 Not Modified``.
+    """
     settings = get_settings()
     exports_root = settings.exports_dir
 
@@ -90,14 +91,29 @@ async def download_export(filename: str) -> FileResponse:
             detail="Invalid filename.",
         )
 
-    if not file_path.is_file():
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Export file not found.",
         )
 
-    return FileResponse(
+    # Passing the stat result lets FileResponse fill in ETag/Last-Modified
+    # up front, without a second stat when the response is sent.
+    response = FileResponse(
         path=str(file_path),
         media_type="application/zip",
         filename=file_path.name,
+        stat_result=stat_result,
+        headers={"Cache-Control": _DOWNLOAD_CACHE_CONTROL},
     )
+    etag = response.headers["etag"]
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": _DOWNLOAD_CACHE_CONTROL},
+        )
+    return response
@@ -15,12 +15,16 @@ CreatureStudio backend can run in a local, file-focused workflow.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple
 
-import json
+import os
+import tempfile
 
-from pydantic import ValidationError
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from app.config import get_settings, Settings
 from app.models.blueprint import BlueprintMeta, SpeciesBlueprint
@@ -42,6 +46,10 @@ class BlueprintValidationError(BlueprintError):
         self.details = details
 
 
+class BlueprintTooLargeError(BlueprintValidationError):
+    """Raised when an imported blueprint exceeds :data:`MAX_IMPORT_BYTES`."""
+
+
 class ProtectedBlueprintError(BlueprintError):
     """Raised when attempting to delete a protected blueprint."""
 
@@ -67,49 +75,161 @@ def _blueprints_dir(settings: Settings | None = None) -> Path:
     return directory
 
 
+# Cache of validated metadata keyed by blueprint path. Each entry remembers the
+# ``(st_mtime_ns, st_size)`` pair it was built from so that edits made outside
+# of this module (e.g. by hand in an editor) are picked up on the next listing.
+_META_CACHE: Dict[Path, Tuple[int, int, BlueprintMeta]] = {}
+
+# Per-directory index from ``meta.name`` to the file that declares it, used by
+# :func:`_resolve_name_to_path` when neither filename convention matches.
+_NAME_INDEX: Dict[Path, Dict[str, Path]] = {}
+
+# Fully validated blueprints for :func:`load_blueprint_shared`, keyed and
+# invalidated the same way as :data:`_META_CACHE`.
+_BLUEPRINT_CACHE: Dict[Path, Tuple[int, int, SpeciesBlueprint]] = {}
+
+
+def clear_blueprint_cache(path: Path | None = None) -> None:
+    """Forget cached metadata for *path*, or for every blueprint if omitted."""
+    if path is None:
+        _META_CACHE.clear()
+        _NAME_INDEX.clear()
+        _BLUEPRINT_CACHE.clear()
+        return
+
+    _META_CACHE.pop(path, None)
+    _BLUEPRINT_CACHE.pop(path, None)
+    index = _NAME_INDEX.get(path.parent)
+    if index:
+        # Snapshot the items in one C-level copy so a concurrent request
+        # thread updating the index cannot break the iteration.
+        for indexed_name, indexed_path in list(index.items()):
+            if indexed_path == path:
+                index.pop(indexed_name, None)
+
+
 def _iter_blueprint_files(settings: Settings | None = None) -> List[Path]:
     """Return a sorted list of JSON files in the blueprints directory."""
     directory = _blueprints_dir(settings)
-    return sorted(p for p in directory.glob("*.json") if p.is_file())
+    # ``DirEntry.is_file`` answers from the cached directory entry type, so
+    # this avoids a separate stat() per file compared to glob + is_file.
+    with os.scandir(directory) as entries:
+        paths = [
+            directory / entry.name
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+    paths.sort()
+    return paths
+
+
+class _BlueprintSummary(BaseModel):
+    """Just the ``meta`` object of a blueprint document.
+
+    Validating JSON against this model lets the parser skip over everything
+    except ``meta`` without building Python objects for it.
+    """
+
+    meta: BlueprintMeta
+
+
+@lru_cache(maxsize=8)
+def _adapter(model: type) -> TypeAdapter[Any]:
+    """Return the shared :class:`TypeAdapter` used to validate *model*."""
+    return TypeAdapter(model)
 
 
-def _load_json_file(path: Path) -> dict:
-    """Load JSON from *path* and return it as a dict."""
+def _read_json_bytes(path: Path) -> bytes:
+    """Return the raw JSON bytes stored at *path*.
+
+    Callers hand these bytes straight to ``validate_json``; there is
+    deliberately no ``str`` decode step in between.
+    """
     try:
-        text = path.read_text(encoding="utf-8")
+        return path.read_bytes()
     except FileNotFoundError as exc:
         raise BlueprintNotFoundError(f"Blueprint file not found: {path}") from exc
 
+
+def _is_malformed_json(exc: ValidationError) -> bool:
+    """Return True if *exc* was raised because the input was not valid JSON."""
+    return any(error["type"] == "json_invalid" for error in exc.errors())
+
+
+def _read_meta(path: Path) -> BlueprintMeta:
+    """Read and validate the meta of *path* without touching any cache."""
+    raw = _read_json_bytes(path)
     try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:
-        raise BlueprintValidationError(
-            f"Blueprint JSON is malformed: {path}", details=str(exc)
-        ) from exc
+        return _adapter(_BlueprintSummary).validate_json(raw).meta
+    except ValidationError as exc:
+        if _is_malformed_json(exc):
+            message = f"Blueprint JSON is malformed: {path}"
+        else:
+            message = f"Blueprint at {path} has invalid meta"
+        raise BlueprintValidationError(message, details=str(exc)) from exc
+
+
+def _cached_meta(path: Path) -> BlueprintMeta | None:
+    """Return the validated meta for *path*, reusing :data:`_META_CACHE`.
+
+    Returns ``None`` if the file disappeared before it could be read.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        clear_blueprint_cache(path)
+        return None
+
+    cached = _META_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    try:
+        meta = _read_meta(path)
+    except BlueprintError:
+        clear_blueprint_cache(path)
+        raise
+    _META_CACHE[path] = (stat.st_mtime_ns, stat.st_size, meta)
+    return meta
 
 
 def list_blueprints(settings: Settings | None = None) -> List[BlueprintMeta]:
     """Return a list of :class:`BlueprintMeta` for all blueprint JSON files.
 
-    Each blueprint file is fully validated as a :class:`SpeciesBlueprint`
-    instance and only the ``meta`` payload is returned.
+    Only the ``meta`` object of each file is validated, as a
+    :class:`BlueprintMeta`; the rest of the document is left for
+    :func:`load_blueprint` to check when the blueprint is actually opened.
+    Results are cached per file and reused for as long as the file's mtime
+    and size are unchanged.
     """
     metas: List[BlueprintMeta] = []
     settings = settings or get_settings()
 
     for path in _iter_blueprint_files(settings):
-        data = _load_json_file(path)
-        try:
-            blueprint = SpeciesBlueprint.parse_obj(data)
-        except ValidationError as exc:
-            raise BlueprintValidationError(
-                f"Blueprint at {path} failed validation", details=str(exc)
-            ) from exc
-        metas.append(blueprint.meta)
+        meta = _cached_meta(path)
+        if meta is not None:
+            metas.append(meta)
 
     return metas
 
 
+def _rebuild_name_index(settings: Settings | None = None) -> Dict[str, Path]:
+    """Rescan the blueprints directory and rebuild its ``meta.name`` index."""
+    directory = _blueprints_dir(settings)
+    index: Dict[str, Path] = {}
+    for path in _iter_blueprint_files(settings):
+        try:
+            meta = _cached_meta(path)
+        except BlueprintError:
+            # Skip invalid files; they will be surfaced by list/load as needed.
+            continue
+        if meta is not None:
+            # First file in sorted order wins, matching the old linear scan.
+            index.setdefault(meta.name, path)
+    _NAME_INDEX[directory] = index
+    return index
+
+
 def _resolve_name_to_path(name: str, settings: Settings | None = None) -> Path:
     """Resolve a logical blueprint *name* to a JSON file path.
 
@@ -117,7 +237,8 @@ def _resolve_name_to_path(name: str, settings: Settings | None = None) -> Path:
 
     1. ``{name}.json``
     2. ``{name}Blueprint.json``
-    3. Any file whose ``meta.name`` field matches *name*.
+    3. Any file whose ``meta.name`` field matches *name*, looked up in
+       :data:`_NAME_INDEX` and rebuilt from disk on a miss or stale hit.
     """
     settings = settings or get_settings()
     directory = _blueprints_dir(settings)
@@ -130,20 +251,50 @@ def _resolve_name_to_path(name: str, settings: Settings | None = None) -> Path:
     if suffixed.is_file():
         return suffixed
 
-    # Fallback: scan all blueprints and match by meta.name
-    for path in _iter_blueprint_files(settings):
-        data = _load_json_file(path)
+    # Fallback: match by meta.name via the index, confirming the hit is still
+    # current before trusting it.
+    indexed = _NAME_INDEX.get(directory, {}).get(name)
+    if indexed is not None:
         try:
-            blueprint = SpeciesBlueprint.parse_obj(data)
-        except ValidationError:
-            # Skip invalid files; they will be surfaced by list/load as needed.
-            continue
-        if blueprint.meta.name == name:
-            return path
+            meta = _cached_meta(indexed)
+        except BlueprintError:
+            meta = None
+        if meta is not None and meta.name == name:
+            return indexed
+
+    indexed = _rebuild_name_index(settings).get(name)
+    if indexed is not None:
+        return indexed
 
     raise BlueprintNotFoundError(f"No blueprint found for name: {name}")
 
 
+def blueprint_etag(name: str, settings: Settings | None = None) -> str:
+    """Return a weak HTTP ETag for the blueprint file backing *name*.
+
+    The tag is derived from the file's mtime and size, so it changes whenever
+    the file is rewritten without needing to read or hash its contents.
+    """
+    path = _resolve_name_to_path(name, settings)
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise BlueprintNotFoundError(f"No blueprint found for name: {name}") from exc
+    return f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _validate_blueprint_file(name: str, path: Path) -> SpeciesBlueprint:
+    raw = _read_json_bytes(path)
+    try:
+        return _adapter(SpeciesBlueprint).validate_json(raw)
+    except ValidationError as exc:
+        if _is_malformed_json(exc):
+            message = f"Blueprint JSON is malformed: {path}"
+        else:
+            message = f"Blueprint '{name}' at {path} failed validation"
+        raise BlueprintValidationError(message, details=str(exc)) from exc
+
+
 def load_blueprint(name: str, settings: Settings | None = None) -> SpeciesBlueprint:
     """Load and validate a blueprint by *name*.
 
@@ -151,13 +302,68 @@ def load_blueprint(name: str, settings: Settings | None = None) -> SpeciesBluepr
     """
     settings = settings or get_settings()
     path = _resolve_name_to_path(name, settings)
-    data = _load_json_file(path)
+    return _validate_blueprint_file(name, path)
+
+
+def load_blueprint_shared(
+    name: str, settings: Settings | None = None
+) -> SpeciesBlueprint:
+    """Like :func:`load_blueprint`, but reuse a cached validated instance.
+
+    The cache is keyed by the file's ``(mtime_ns, size)`` so edits on disk
+    are picked up. The returned object is shared between callers and must be
+    treated as read-only; use :func:`load_blueprint` for a private copy.
+    """
+    settings = settings or get_settings()
+    path = _resolve_name_to_path(name, settings)
     try:
-        return SpeciesBlueprint.parse_obj(data)
-    except ValidationError as exc:
-        raise BlueprintValidationError(
-            f"Blueprint '{name}' at {path} failed validation", details=str(exc)
-        ) from exc
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        clear_blueprint_cache(path)
+        raise BlueprintNotFoundError(f"No blueprint found for name: {name}") from exc
+
+    cached = _BLUEPRINT_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    blueprint = _validate_blueprint_file(name, path)
+    _BLUEPRINT_CACHE[path] = (stat.st_mtime_ns, stat.st_size, blueprint)
+    return blueprint
+
+
+def _current_umask() -> int:
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+# mkstemp() creates files as 0600; saved blueprints get the permissions a
+# plain open() would have given them.
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a sibling temp file and ``os.replace``.
+
+    Readers either see the previous file or the complete new one, never a
+    partially written document. Each call gets its own uniquely named temp
+    file, so concurrent saves of the same blueprint cannot interleave; the
+    last ``os.replace`` wins.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.chmod(tmp_name, _NEW_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def save_blueprint(
@@ -174,21 +380,20 @@ def save_blueprint(
 
     # Ensure the meta.name matches the logical name for consistency.
     if blueprint.meta.name != name:
-        meta = blueprint.meta.copy(update={"name": name})
-        blueprint = blueprint.copy(update={"meta": meta})
+        meta = blueprint.meta.model_copy(update={"name": name})
+        blueprint = blueprint.model_copy(update={"meta": meta})
 
-    # Pydantic v1 vs v2 compatibility for dict export.
-    try:
-        payload = blueprint.model_dump()
-    except AttributeError:
-        payload = blueprint.dict()
+    payload = blueprint.model_dump()
 
-    text = json.dumps(payload, indent=2, sort_keys=False)
-    path.write_text(text, encoding="utf-8")
+    _atomic_write_bytes(path, orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    clear_blueprint_cache(path)
+    index = _NAME_INDEX.get(directory)
+    if index is not None:
+        index.setdefault(name, path)
     return path
 
 
-PROTECTED_BLUEPRINTS = {"Elephant"}
+PROTECTED_BLUEPRINTS = frozenset({"Elephant"})
 
 
 def delete_blueprint(name: str, settings: Settings | None = None) -> None:
@@ -203,6 +408,7 @@ def delete_blueprint(name: str, settings: Settings | None = None) -> None:
                                       f"cannot be deleted.")
 
     path = _resolve_name_to_path(name, settings)
+    clear_blueprint_cache(path)
     try:
         path.unlink()
     except FileNotFoundError as exc:
@@ -210,7 +416,8 @@ def delete_blueprint(name: str, settings: Settings | None = None) -> None:
 
 # === Template + Import helpers (Phase 6) =====================================
 
-TEMPLATE_FILE_MAP = {
+# Keys are already normalized (see _normalize_template_type).
+TEMPLATE_FILE_MAP = MappingProxyType({
     "quadruped": "TemplateQuadruped.json",
     "biped": "TemplateBiped.json",
     "winged": "TemplateWinged.json",
@@ -218,7 +425,14 @@ TEMPLATE_FILE_MAP = {
     "no-ped": "TemplateNoPed.json",
     "no_ped": "TemplateNoPed.json",
     "nopeds": "TemplateNoPed.json",
-}
+})
+
+_TEMPLATE_TYPES_MESSAGE = ", ".join(sorted(TEMPLATE_FILE_MAP))
+
+
+def _normalize_template_type(template_type: str | None) -> str:
+    """Return the TEMPLATE_FILE_MAP lookup key for a user-supplied label."""
+    return (template_type or "").strip().lower()
 
 
 def _templates_dir(settings: Settings | None = None) -> Path:
@@ -240,9 +454,12 @@ def load_template_blueprint(template_type: str, settings: Settings | None = None
 
     This is intentionally forgiving about the label. It normalizes the
     template_type string and then looks it up in TEMPLATE_FILE_MAP.
+
+    The returned object is cached and shared between callers, so it must be
+    treated as read-only; derive edited blueprints with ``model_copy``.
     """
     settings = settings or get_settings()
-    key = (template_type or "").strip().lower()
+    key = _normalize_template_type(template_type)
     if not key:
         raise BlueprintValidationError("templateType must be a non-empty string")
 
@@ -250,27 +467,35 @@ def load_template_blueprint(template_type: str, settings: Settings | None = None
     if filename is None:
         raise BlueprintValidationError(
             f"Unknown templateType '{template_type}'. "
-            f"Expected one of: {', '.join(sorted(TEMPLATE_FILE_MAP.keys()))}."
+            f"Expected one of: {_TEMPLATE_TYPES_MESSAGE}."
         )
 
     templates_dir = _templates_dir(settings=settings)
+    return _load_template_cached(templates_dir, filename)
+
+
+@lru_cache(maxsize=16)
+def _load_template_cached(templates_dir: Path, filename: str) -> SpeciesBlueprint:
+    """Read and validate a template file once per process.
+
+    Templates ship with the app and are not edited at runtime, so unlike
+    user blueprints they are cached without any mtime check.
+    """
     path = templates_dir / filename
     if not path.exists():
         raise BlueprintNotFoundError(
             f"Template blueprint file '{filename}' not found in {templates_dir}"
         )
 
-    data = _load_json_file(path)
+    raw = _read_json_bytes(path)
     try:
-        blueprint = SpeciesBlueprint.parse_obj(data)
+        return _adapter(SpeciesBlueprint).validate_json(raw)
     except ValidationError as exc:
         raise BlueprintValidationError(
             f"Template blueprint '{filename}' failed validation",
             details=str(exc),
         ) from exc
 
-    return blueprint
-
 
 def create_blueprint_from_template(
     name: str,
@@ -311,14 +536,19 @@ def create_blueprint_from_template(
 
     # Copy and update meta.name only; everything else (chains, bodyPlan, sizes,
     # bodyParts, materials, behaviorPresets) flows from the template.
-    meta = template_blueprint.meta.copy(update={"name": name})
-    new_blueprint = template_blueprint.copy(update={"meta": meta})
+    meta = template_blueprint.meta.model_copy(update={"name": name})
+    new_blueprint = template_blueprint.model_copy(update={"meta": meta})
 
     # Persist the blueprint to disk and return the in-memory object.
     save_blueprint(name, new_blueprint, settings=settings)
     return new_blueprint
 
 
+# Upper bound on the size of an imported blueprint document. Real blueprints
+# are tens of kilobytes; this only exists to cap memory use on bad uploads.
+MAX_IMPORT_BYTES = 5 * 1024 * 1024
+
+
 def import_blueprint_from_bytes(
     payload: bytes,
     settings: Settings | None = None,
@@ -327,37 +557,28 @@ def import_blueprint_from_bytes(
     Import a SpeciesBlueprint from raw JSON bytes.
 
     This helper performs:
-    * UTF-8 decoding
-    * JSON parsing
-    * pydantic validation into SpeciesBlueprint
+    * a size check against MAX_IMPORT_BYTES
+    * JSON parsing and pydantic validation into SpeciesBlueprint, in a
+      single pass straight from the UTF-8 bytes
     * protection against overwriting canonical built-ins
     * persistence via save_blueprint
     """
     settings = settings or get_settings()
 
-    try:
-        text = payload.decode("utf-8")
-    except UnicodeDecodeError as exc:
-        raise BlueprintValidationError(
-            "Import payload is not valid UTF-8",
-            details=str(exc),
-        ) from exc
-
-    try:
-        raw = json.loads(text)
-    except json.JSONDecodeError as exc:
-        raise BlueprintValidationError(
-            "Import payload is not valid JSON",
-            details=str(exc),
-        ) from exc
+    if len(payload) > MAX_IMPORT_BYTES:
+        raise BlueprintTooLargeError(
+            f"Import payload exceeds the {MAX_IMPORT_BYTES} byte limit"
+        )
 
     try:
-        blueprint = SpeciesBlueprint.parse_obj(raw)
+        blueprint = _adapter(SpeciesBlueprint).validate_json(payload)
     except ValidationError as exc:
-        raise BlueprintValidationError(
-            "Imported blueprint failed validation",
-            details=str(exc),
-        ) from exc
+        if _is_malformed_json(exc):
+            # Covers both invalid UTF-8 and syntactically broken JSON.
+            message = "Import payload is not valid JSON"
+        else:
+            message = "Imported blueprint failed validation"
+        raise BlueprintValidationError(message, details=str(exc)) from exc
 
     name = (blueprint.meta.name or "").strip()
     if not name:
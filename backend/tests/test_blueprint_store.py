@@ -0,0 +1,104 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from app.config import Settings, get_settings
+from app.services.blueprint_store import (
+    BlueprintNotFoundError,
+    list_blueprints,
+    load_blueprint,
+    load_blueprint_shared,
+    save_blueprint,
+)
+
+
+def _isolated_settings(tmp_path: Path) -> Settings:
+    """Return Settings whose blueprints_dir points at an empty temp folder."""
+    return Settings(blueprints_dir=tmp_path)
+
+
+def _write_elephant_copy(directory: Path, name: str) -> Path:
+    elephant_path = get_settings().blueprints_dir / "ElephantBlueprint.json"
+    data = json.loads(elephant_path.read_text(encoding="utf-8"))
+    data["meta"]["name"] = name
+    target = directory / f"{name}Blueprint.json"
+    target.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return target
+
+
+def test_list_blueprints_picks_up_changes_on_disk(tmp_path):
+    settings = _isolated_settings(tmp_path)
+    path = _write_elephant_copy(tmp_path, "CacheProbe")
+
+    first = list_blueprints(settings)
+    assert [m.name for m in first] == ["CacheProbe"]
+
+    # A second call with the file untouched reuses the cached meta.
+    second = list_blueprints(settings)
+    assert second[0] is first[0]
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["meta"]["version"] = "9.9.9-cache-probe"
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    third = list_blueprints(settings)
+    assert third[0].version == "9.9.9-cache-probe"
+
+    path.unlink()
+    assert list_blueprints(settings) == []
+
+
+def test_load_blueprint_resolves_by_meta_name_and_tracks_renames(tmp_path):
+    settings = _isolated_settings(tmp_path)
+    source = _write_elephant_copy(tmp_path, "IndexProbe")
+    path = source.rename(tmp_path / "unconventional_filename.json")
+
+    assert load_blueprint("IndexProbe", settings).meta.name == "IndexProbe"
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["meta"]["name"] = "IndexProbeRenamed"
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    with pytest.raises(BlueprintNotFoundError):
+        load_blueprint("IndexProbe", settings)
+    assert load_blueprint("IndexProbeRenamed", settings).meta.name == "IndexProbeRenamed"
+
+
+def test_load_blueprint_shared_reuses_instance_until_file_changes(tmp_path):
+    settings = _isolated_settings(tmp_path)
+    path = _write_elephant_copy(tmp_path, "SharedProbe")
+
+    first = load_blueprint_shared("SharedProbe", settings)
+    assert load_blueprint_shared("SharedProbe", settings) is first
+    assert load_blueprint("SharedProbe", settings) is not first
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["meta"]["version"] = "9.9.9-shared-probe"
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    reloaded = load_blueprint_shared("SharedProbe", settings)
+    assert reloaded is not first
+    assert reloaded.meta.version == "9.9.9-shared-probe"
+
+
+def test_concurrent_saves_of_one_name_never_corrupt_the_file(tmp_path):
+    settings = _isolated_settings(tmp_path)
+    _write_elephant_copy(tmp_path, "RaceProbe")
+    base = load_blueprint("RaceProbe", settings)
+    # Bodies of different lengths would interleave into invalid JSON if the
+    # writers shared one temp file.
+    variants = [
+        base.model_copy(
+            update={"meta": base.meta.model_copy(update={"version": "9." * n + "9"})}
+        )
+        for n in (1, 5000, 50, 20000) * 4
+    ]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda bp: save_blueprint("RaceProbe", bp, settings), variants))
+
+    saved = load_blueprint("RaceProbe", settings)
+    assert len(saved.meta.version) in {3, 10001, 101, 40001}
+    assert [p.name for p in tmp_path.iterdir()] == ["RaceProbeBlueprint.json"]
@@ -1,6 +1,6 @@
-import json
 from pathlib import Path
 
+import orjson
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -18,6 +18,19 @@ def test_list_blueprints_includes_elephant():
     assert "Elephant" in names
 
 
+def test_list_blueprints_with_invalid_file_returns_500(tmp_path, monkeypatch):
+    (tmp_path / "BrokenBlueprint.json").write_bytes(b"{not json")
+    monkeypatch.setenv("CREATURESTUDIO_BLUEPRINTS_DIR", str(tmp_path))
+    get_settings.cache_clear()
+    try:
+        response = client.get("/api/blueprints")
+    finally:
+        get_settings.cache_clear()
+
+    assert response.status_code == 500
+    assert "BrokenBlueprint.json" in response.json()["detail"]
+
+
 def test_get_elephant_blueprint_round_trip():
     response = client.get("/api/blueprints/Elephant")
     assert response.status_code == 200
@@ -36,7 +49,7 @@ def test_put_and_get_custom_blueprint(tmp_path):
     elephant_path = blueprints_dir / "ElephantBlueprint.json"
     assert elephant_path.is_file(), "ElephantBlueprint.json must exist for tests."
 
-    elephant_data = json.loads(elephant_path.read_text(encoding="utf-8"))
+    elephant_data = orjson.loads(elephant_path.read_bytes())
 
     # Modify the meta to create a new animal.
     elephant_data["meta"]["name"] = "TestAnimal"
@@ -55,3 +68,30 @@ def test_put_and_get_custom_blueprint(tmp_path):
     data = response_get.json()
     assert data["meta"]["name"] == "TestAnimal"
     assert data["meta"]["version"] == "0.0.1"
+
+
+def test_get_unknown_blueprint_returns_404():
+    response = client.get("/api/blueprints/DefinitelyNotARealSpecies")
+    assert response.status_code == 404
+    assert "DefinitelyNotARealSpecies" in response.json()["detail"]
+
+
+def test_get_blueprint_honours_if_none_match():
+    first = client.get("/api/blueprints/Elephant")
+    assert first.status_code == 200
+    etag = first.headers.get("etag")
+    assert etag
+
+    second = client.get("/api/blueprints/Elephant", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers.get("etag") == etag
+    assert second.content == b""
+
+
+def test_put_invalid_blueprint_returns_422_with_body_locations():
+    response = client.put("/api/blueprints/InvalidProbe", json={"meta": {}})
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    locations = [error["loc"] for error in errors]
+    assert ["body", "meta", "name"] in locations
+    assert all("input" not in error for error in errors)
@@ -1,14 +1,20 @@
+import hashlib
 import json
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from app.config import get_settings
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings, get_settings
+from app.main import app
 from app.models.blueprint import SpeciesBlueprint
 from app.services.export_service import export_animal
 
 
 def test_export_elephant_creates_zip_with_expected_files(tmp_path):
-    settings = get_settings()
+    settings = Settings(exports_dir=tmp_path)
     blueprints_dir = settings.blueprints_dir
 
     elephant_path = blueprints_dir / "ElephantBlueprint.json"
@@ -31,3 +37,80 @@ def test_export_elephant_creates_zip_with_expected_files(tmp_path):
     assert any(name.endswith("ElephantBehavior.js") for name in names)
     assert any(name.endswith("ElephantPen.js") for name in names)
     assert any(name.endswith("ElephantBlueprint.json") for name in names)
+
+
+def test_export_manifest_checksums_match_archive_contents(tmp_path):
+    settings = Settings(exports_dir=tmp_path)
+    elephant_path = settings.blueprints_dir / "ElephantBlueprint.json"
+    elephant_blueprint = SpeciesBlueprint.model_validate_json(elephant_path.read_bytes())
+
+    zip_path = export_animal(elephant_blueprint, "4.1.0", config=settings)
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        manifest = json.loads(zf.read("manifest.json"))
+        payloads = manifest["payloads"]
+        assert "AnimalDefinition.json" in payloads
+        assert "materials.json" in payloads
+        for name, checksum in payloads.items():
+            assert hashlib.sha256(zf.read(name)).hexdigest() == checksum, name
+
+        # Payloads carrying blueprint data are key-sorted, whatever the key
+        # order of the source blueprint.
+        for name in ("AnimalDefinition.json", "materials.json", "runtime.json"):
+            data = json.loads(zf.read(name))
+            assert json.dumps(data, sort_keys=True) == json.dumps(data), name
+
+        definition = json.loads(zf.read("AnimalDefinition.json"))
+        assert definition["speciesKey"] == "Elephant"
+        assert definition["materials"] == json.loads(zf.read("materials.json"))["slots"]
+
+
+@pytest.fixture
+def isolated_exports_dir(tmp_path, monkeypatch):
+    """Point the app's cached settings at a temporary exports_dir.
+
+    The export routes read get_settings() directly, so the override goes
+    through the environment and the settings cache is reset around the test.
+    """
+    monkeypatch.setenv("CREATURESTUDIO_EXPORTS_DIR", str(tmp_path))
+    get_settings.cache_clear()
+    yield tmp_path
+    get_settings.cache_clear()
+
+
+def test_export_download_supports_conditional_requests(isolated_exports_dir):
+    client = TestClient(app)
+    export = client.post("/api/export/Elephant", json={"version": "0.0.1-cache"})
+    assert export.status_code == 200
+    download_path = export.json()["zipPath"]
+    assert (isolated_exports_dir / download_path.rsplit("/", 1)[-1]).is_file()
+
+    first = client.get(download_path)
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+    etag = first.headers["etag"]
+
+    second = client.get(download_path, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+
+
+def test_concurrent_exports_of_one_bundle_each_produce_a_valid_zip(tmp_path):
+    settings = Settings(exports_dir=tmp_path)
+    elephant_path = settings.blueprints_dir / "ElephantBlueprint.json"
+    elephant_blueprint = SpeciesBlueprint.model_validate_json(elephant_path.read_bytes())
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        zip_paths = list(
+            pool.map(
+                lambda _: export_animal(elephant_blueprint, "0.0.1-race", config=settings),
+                range(8),
+            )
+        )
+
+    assert set(zip_paths) == {tmp_path / "ElephantV0.0.1-race.zip"}
+    with zipfile.ZipFile(zip_paths[0], "r") as zf:
+        assert zf.testzip() is None
+    # Every writer used its own temp file, and none was left behind.
+    assert [p.name for p in tmp_path.iterdir()] == ["ElephantV0.0.1-race.zip"]
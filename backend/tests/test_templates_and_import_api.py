@@ -12,17 +12,19 @@ These tests focus on:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Iterable
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.config import get_settings
 from app.models.blueprint import SpeciesBlueprint
+from app.services import blueprint_store
 from app.services.blueprint_store import (
+    MAX_IMPORT_BYTES,
     TEMPLATE_FILE_MAP,
     BlueprintValidationError,
     ProtectedBlueprintError,
@@ -40,16 +42,11 @@ client = TestClient(app)
 # ---------------------------------------------------------------------------
 
 
-def _blueprints_dir() -> Path:
-    settings = get_settings()
-    return settings.blueprints_dir
-
-
-def _templates_dir() -> Path:
-    settings = get_settings()
-    # The service helper uses settings.templates_dir internally; we mirror
-    # that here so the tests stay aligned with production behaviour.
-    return settings.templates_dir
+# Resolved once per module; the service helpers read the same settings
+# object, so the tests stay aligned with production behaviour.
+_SETTINGS = get_settings()
+_BLUEPRINTS_DIR: Path = _SETTINGS.blueprints_dir
+_TEMPLATES_DIR: Path = _SETTINGS.templates_dir
 
 
 def _cleanup_blueprints(names: Iterable[str]) -> None:
@@ -59,7 +56,7 @@ def _cleanup_blueprints(names: Iterable[str]) -> None:
     We do not treat failure to delete as a test failure, but we keep cleanup
     explicit so repeated test runs remain deterministic.
     """
-    directory = _blueprints_dir()
+    directory = _BLUEPRINTS_DIR
     for name in names:
         path = directory / f"{name}Blueprint.json"
         try:
@@ -80,7 +77,7 @@ def test_template_files_exist_for_all_template_map_entries() -> None:
     This ensures that the "templateType" options surfaced to the frontend
     have a corresponding blueprint template that can be cloned.
     """
-    templates_dir = _templates_dir()
+    templates_dir = _TEMPLATES_DIR
     assert templates_dir.is_dir(), f"Templates dir does not exist: {templates_dir}"
 
     # Use unique filenames in case multiple keys alias the same template file.
@@ -129,7 +126,7 @@ def test_create_blueprint_from_template_persists_file_and_normalises_meta_name()
     - persist {name}Blueprint.json to the blueprints directory.
     """
     name = "UnitTest_QuadrupedFromTemplate_Service"
-    target_path = _blueprints_dir() / f"{name}Blueprint.json"
+    target_path = _BLUEPRINTS_DIR / f"{name}Blueprint.json"
 
     _cleanup_blueprints([name])
 
@@ -164,7 +161,7 @@ def test_api_create_blueprint_from_template_happy_path() -> None:
     - persist the new blueprint file on disk.
     """
     name = "UnitTest_QuadrupedFromTemplate_API"
-    target_path = _blueprints_dir() / f"{name}Blueprint.json"
+    target_path = _BLUEPRINTS_DIR / f"{name}Blueprint.json"
 
     _cleanup_blueprints([name])
 
@@ -209,6 +206,22 @@ def test_api_create_blueprint_from_template_protected_name_returns_409() -> None
     assert "protected" in detail or "cannot be used" in detail.lower()
 
 
+def test_api_create_blueprint_from_missing_template_file_returns_500(monkeypatch) -> None:
+    """
+    A template file missing from the install is a server error (HTTP 500),
+    not a 404 for the client's request.
+    """
+    monkeypatch.setattr(
+        blueprint_store, "TEMPLATE_FILE_MAP", {"quadruped": "UnitTest_Missing.json"}
+    )
+    response = client.post(
+        "/api/blueprints",
+        json={"name": "UnitTest_MissingTemplate_API", "templateType": "quadruped"},
+    )
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Failed to create blueprint from template"
+
+
 # ---------------------------------------------------------------------------
 # API: POST /api/blueprints/import
 # ---------------------------------------------------------------------------
@@ -218,8 +231,7 @@ def _load_elephant_blueprint_bytes() -> bytes:
     """
     Helper: load the canonical ElephantBlueprint.json as bytes.
     """
-    settings = get_settings()
-    elephant_path = settings.blueprints_dir / "ElephantBlueprint.json"
+    elephant_path = _BLUEPRINTS_DIR / "ElephantBlueprint.json"
     assert elephant_path.is_file(), f"Expected Elephant blueprint at {elephant_path}"
     return elephant_path.read_bytes()
 
@@ -229,18 +241,17 @@ def test_api_import_blueprint_happy_path() -> None:
     Importing a tweaked copy of the Elephant blueprint via the API should
     result in a new on-disk blueprint + a SpeciesBlueprint JSON response.
     """
-    settings = get_settings()
     name = "UnitTest_ImportedElephant"
-    target_path = settings.blueprints_dir / f"{name}Blueprint.json"
+    target_path = _BLUEPRINTS_DIR / f"{name}Blueprint.json"
 
     _cleanup_blueprints([name])
 
     try:
         raw = _load_elephant_blueprint_bytes()
-        data = json.loads(raw.decode("utf-8"))
+        data = orjson.loads(raw)
         # Use a unique test name so we do not collide with Elephant itself.
         data["meta"]["name"] = name
-        payload = json.dumps(data).encode("utf-8")
+        payload = orjson.dumps(data)
 
         files = {"file": ("ImportedElephant.json", payload, "application/json")}
         response = client.post("/api/blueprints/import", files=files)
@@ -274,16 +285,28 @@ def test_api_import_blueprint_invalid_json_returns_400() -> None:
     assert "Import payload is not valid JSON" in detail
 
 
+def test_api_import_blueprint_oversized_payload_returns_413() -> None:
+    """
+    Uploads larger than MAX_IMPORT_BYTES should be rejected with HTTP 413
+    before any parsing is attempted.
+    """
+    payload = b" " * (MAX_IMPORT_BYTES + 1)
+    files = {"file": ("huge.json", payload, "application/json")}
+    response = client.post("/api/blueprints/import", files=files)
+    assert response.status_code == 413
+    assert "byte limit" in response.json().get("detail", "")
+
+
 def test_api_import_blueprint_missing_name_returns_400() -> None:
     """
     Importing a blueprint payload without a usable meta.name should
     return HTTP 400 with a helpful message.
     """
     raw = _load_elephant_blueprint_bytes()
-    data = json.loads(raw.decode("utf-8"))
+    data = orjson.loads(raw)
     data["meta"]["name"] = ""
 
-    payload = json.dumps(data).encode("utf-8")
+    payload = orjson.dumps(data)
     files = {"file": ("no-name.json", payload, "application/json")}
 
     response = client.post("/api/blueprints/import", files=files)
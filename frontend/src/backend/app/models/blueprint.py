@@ -113,28 +113,6 @@ class ChainDefinition(BaseModel):
     )
 
 
-class BodyPartDefinition(BaseModel):
-    """
-    Generalised body part definition used by the anatomy V2 pipeline.
-
-    Each body part definition assigns a generator to a named chain and
-    provides generator-specific options.  The name field is purely
-    descriptive and need not match the chain name.
-    """
-
-    name: str = Field(description="Descriptive name of this body part.")
-    generator: str = Field(
-        description="Key identifying which generator to invoke (e.g. 'torsoGenerator', 'limbGenerator', 'wingGenerator')."
-    )
-    chain: str = Field(
-        description="Name of the chain this body part uses (must match a ChainDefinition name)."
-    )
-    options: BodyPartOptions = Field(
-        default_factory=dict,
-        description="Generator-specific tuning options.",
-    )
-
-
 class SizeProfile(BaseModel):
     """Simple size or radius profile for a bone or chain."""
 
@@ -259,6 +237,28 @@ BodyPartOptions = Union[
 ]
 
 
+class BodyPartDefinition(BaseModel):
+    """
+    Generalised body part definition used by the anatomy V2 pipeline.
+
+    Each body part definition assigns a generator to a named chain and
+    provides generator-specific options.  The name field is purely
+    descriptive and need not match the chain name.
+    """
+
+    name: str = Field(description="Descriptive name of this body part.")
+    generator: str = Field(
+        description="Key identifying which generator to invoke (e.g. 'torsoGenerator', 'limbGenerator', 'wingGenerator')."
+    )
+    chain: str = Field(
+        description="Name of the chain this body part uses (must match a ChainDefinition name)."
+    )
+    options: BodyPartOptions = Field(
+        default_factory=dict,
+        description="Generator-specific tuning options.",
+    )
+
+
 class BodyPartRef(BaseModel):
     """Configuration for a single body part generator."""
 
@@ -356,9 +356,12 @@ class SpeciesBlueprint(BaseModel):
         if self.bodyPartsV2 and not chain_names:
             raise ValueError("chainsV2 must be provided when bodyPartsV2 are defined")
 
-        # Validate that chain bones exist in the skeleton
+        # Validate that chain bones exist in the skeleton. The set containment
+        # checks run in C; the list of offenders is only built on failure.
         skeleton_bones = {b.name for b in self.skeleton.bones}
         for chain in self.chainsV2:
+            if skeleton_bones.issuperset(chain.bones):
+                continue
             missing_bones = [bone for bone in chain.bones if bone not in skeleton_bones]
             if missing_bones:
                 raise ValueError(
@@ -372,16 +375,21 @@ class SpeciesBlueprint(BaseModel):
                     f"Body part '{part.name}' targets unknown chain '{part.chain}'. "
                     f"Known chains: {', '.join(sorted(chain_names)) or 'none'}"
                 )
-            options = getattr(part, "options", {}) or {}
-            if isinstance(options, dict):
-                additional = options.get("additionalChains") or []
+            options = part.options
+            additional = (
+                options.get("additionalChains") or ()
+                if isinstance(options, dict)
+                else ()
+            )
+            # One C-level set difference; the ordered error list is only
+            # built when something is actually missing.
+            if set(additional) - chain_names:
                 missing_additional = [name for name in additional if name not in chain_names]
-                if missing_additional:
-                    raise ValueError(
-                        "Body part '"
-                        + part.name
-                        + "' references unknown additionalChains: "
-                        + ", ".join(missing_additional)
-                    )
+                raise ValueError(
+                    "Body part '"
+                    + part.name
+                    + "' references unknown additionalChains: "
+                    + ", ".join(missing_additional)
+                )
 
         return self
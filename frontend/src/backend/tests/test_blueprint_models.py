@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.blueprint import SpeciesBlueprint
+
+
+# This legacy copy's Settings resolve shared/ relative to frontend/src, so the
+# fixture is located from the repository root instead.
+_ELEPHANT_PATH = (
+    Path(__file__).resolve().parents[4] / "shared" / "blueprints" / "ElephantBlueprint.json"
+)
+
+
+def _elephant_data() -> dict:
+    return json.loads(_ELEPHANT_PATH.read_text(encoding="utf-8"))
+
+
+def test_elephant_blueprint_passes_v2_chain_checks():
+    blueprint = SpeciesBlueprint.model_validate(_elephant_data())
+    assert blueprint.chainsV2 and blueprint.bodyPartsV2
+
+
+def test_chain_with_unknown_bones_is_rejected_with_ordered_names():
+    data = _elephant_data()
+    chain = data["chainsV2"][0]
+    chain["bones"] += ["ghost_b", "ghost_a"]
+
+    with pytest.raises(ValidationError) as excinfo:
+        SpeciesBlueprint.model_validate(data)
+    assert (
+        f"Chain '{chain['name']}' references missing bones: ghost_b, ghost_a"
+        in str(excinfo.value)
+    )
+
+
+def test_unknown_additional_chains_are_rejected_with_ordered_names():
+    data = _elephant_data()
+    part = data["bodyPartsV2"][0]
+    known = data["chainsV2"][-1]["name"]
+    # A non-numeric "sides" matches none of the typed option models, so the
+    # options stay a plain dict and additionalChains is checked.
+    part["options"] = {"sides": "many", "additionalChains": ["nope_b", known, "nope_a"]}
+
+    with pytest.raises(ValidationError) as excinfo:
+        SpeciesBlueprint.model_validate(data)
+    assert (
+        f"Body part '{part['name']}' references unknown additionalChains: nope_b, nope_a"
+        in str(excinfo.value)
+    )
+
+    part["options"]["additionalChains"] = [known]
+    SpeciesBlueprint.model_validate(data)
@@ -23,11 +23,23 @@ run directly in the Python environment.  It complements the Node
 smoke tests by verifying the integrity of the blueprint data.
 """
 
+import argparse
 import json
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _loads(raw: bytes):
+    """Parse JSON *raw* bytes, using orjson when it is installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 KNOWN_GENERATORS = {
     "torsoGenerator",
@@ -39,10 +51,28 @@ KNOWN_GENERATORS = {
     "earGenerator",
 }
 
+# Only blueprints at or above this schema version define the V2 fields.
+MIN_VERSION = (4, 2, 0)
+
 
-def validate_blueprint(path: Path):
-    data = json.loads(path.read_text())
-    name = data.get("meta", {}).get("name", path.stem)
+@lru_cache(maxsize=None)
+def _parse_version(version: str) -> tuple:
+    """Return *version* as a ``(major, minor, patch)`` tuple of ints.
+
+    Comparing tuples keeps ``"4.10.0"`` above ``"4.2.0"``, which a plain
+    string comparison gets wrong. Pre-release and build suffixes are
+    ignored; unparseable versions map to ``(0, 0, 0)``.
+    """
+    core = version.split("-", 1)[0].split("+", 1)[0]
+    try:
+        parts = tuple(int(part) for part in core.split(".")[:3])
+    except ValueError:
+        return (0, 0, 0)
+    return parts + (0,) * (3 - len(parts))
+
+
+def validate_blueprint(name: str, data: dict):
+    """Check the V2 anatomy fields of the already-parsed blueprint *data*."""
     chains = data.get("chainsV2", [])
     body_parts = data.get("bodyPartsV2", [])
     # Ensure list types
@@ -52,8 +82,10 @@ def validate_blueprint(path: Path):
     for chain in chains:
         assert isinstance(chain.get("name"), str) and chain["name"], f"{name}: chain missing or invalid name"
         assert isinstance(chain.get("bones"), list) and chain["bones"], f"{name}: chain {chain['name']} must define bones"
-        assert chain["name"] not in chain_names, f"{name}: duplicate chain name {chain['name']}"
+        # add() then a size check hashes the name once instead of twice.
+        seen = len(chain_names)
         chain_names.add(chain["name"])
+        assert len(chain_names) != seen, f"{name}: duplicate chain name {chain['name']}"
     part_names = set()
     for part in body_parts:
         assert isinstance(part.get("name"), str) and part["name"], f"{name}: body part missing or invalid name"
@@ -61,12 +93,21 @@ def validate_blueprint(path: Path):
         assert isinstance(part.get("generator"), str) and part["generator"], f"{name}: body part {part['name']} must specify a generator"
         assert part["chain"] in chain_names, f"{name}: body part {part['name']} references unknown chain {part['chain']}"
         assert part["generator"] in KNOWN_GENERATORS, f"{name}: body part {part['name']} uses unknown generator {part['generator']}"
-        assert part["name"] not in part_names, f"{name}: duplicate body part name {part['name']}"
+        seen = len(part_names)
         part_names.add(part["name"])
+        assert len(part_names) != seen, f"{name}: duplicate body part name {part['name']}"
     print(f"{name}: {len(chains)} chains, {len(body_parts)} body parts validated successfully")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Sanity-check V2 blueprint anatomy fields.")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first blueprint that fails validation",
+    )
+    args = parser.parse_args()
+
     # Discover blueprint files in shared/blueprints and frontend/src/blueprints
     root = Path(__file__).resolve().parents[1]
     blueprint_dirs = [
@@ -77,18 +118,23 @@ def main():
     for bp_dir in blueprint_dirs:
         for path in bp_dir.glob("*.json"):
             try:
-                data = json.loads(path.read_text())
-            except Exception:
+                data = _loads(path.read_bytes())
+            except (OSError, ValueError):
+                # Unreadable or malformed JSON (both decoders raise a
+                # ValueError subclass); this script only checks V2 fields.
                 continue
             # Only validate if schemaVersion >= 4.2.0 and defines V2 fields
             meta = data.get("meta", {})
             version = meta.get("schemaVersion", "0.0.0")
-            if not version or version < "4.2.0":
+            if not version or _parse_version(version) < MIN_VERSION:
                 continue
+            name = meta.get("name", path.stem)
             try:
-                validate_blueprint(path)
+                validate_blueprint(name, data)
             except AssertionError as e:
                 print(f"Validation failed for {path.name}: {e}")
+                if args.fail_fast:
+                    raise SystemExit(1)
                 ok = False
     if not ok:
         raise SystemExit(1)
@@ -1,142 +1,173 @@
 """Upgrade the Elephant blueprint to schema version 4.1.0 with geometry options."""
 import argparse
 import json
+import os
+import uuid
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 SCHEMA_VERSION = "4.1.0"
 
 
-def build_elephant_options():
-    torso_options = {
-        "radii": [1.15, 1.35, 1.0],
-        "sides": 28,
-        "radiusProfile": "elephant_heavy",
-        "rumpBulgeDepth": 0.4,
-        "extendRumpToRearLegs": {
-            "bones": [
-                "back_left_foot",
-                "back_right_foot",
-                "back_left_lower",
-                "back_right_lower",
-                "back_left_upper",
-                "back_right_upper",
-            ],
-            "extraMargin": 0.05,
-            "boneRadii": {
-                "back_left_upper": 0.5,
-                "back_right_upper": 0.5,
-                "back_left_lower": 0.42,
-                "back_right_lower": 0.42,
-                "back_left_foot": 0.44,
-                "back_right_foot": 0.44,
-            },
+def _loads(raw: bytes):
+    """Parse JSON *raw* bytes, using orjson when it is installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps(value) -> bytes:
+    """Serialize *value* as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode("utf-8")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a sibling temp file and ``os.replace``.
+
+    A failed or interrupted upgrade leaves any existing output untouched
+    instead of a truncated document. The temp name is unique per call and
+    opened exclusively, so two runs writing the same output never share it.
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "xb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Option templates shared by every build_elephant_options() call. They are
+# only ever serialized, never mutated, so the returned parts reference them
+# directly and mirrored parts (tusks, legs) share one dict.
+_TORSO_OPTIONS = {
+    "radii": [1.15, 1.35, 1.0],
+    "sides": 28,
+    "radiusProfile": "elephant_heavy",
+    "rumpBulgeDepth": 0.4,
+    "extendRumpToRearLegs": {
+        "bones": [
+            "back_left_foot",
+            "back_right_foot",
+            "back_left_lower",
+            "back_right_lower",
+            "back_left_upper",
+            "back_right_upper",
+        ],
+        "extraMargin": 0.05,
+        "boneRadii": {
+            "back_left_upper": 0.5,
+            "back_right_upper": 0.5,
+            "back_left_lower": 0.42,
+            "back_right_lower": 0.42,
+            "back_left_foot": 0.44,
+            "back_right_foot": 0.44,
         },
-        "lowPoly": False,
-        "lowPolySegments": 9,
-        "lowPolyWeldTolerance": 0.02,
-    }
-
-    neck_options = {
-        "radii": [0.95, 0.38],
-        "sides": 18,
-        "capBase": True,
-        "capEnd": True,
-    }
-
-    head_options = {
-        "parentBone": "head",
-        "radius": 0.95,
-        "sides": 22,
-        "elongation": 1.0,
-    }
-
-    trunk_options = {
-        "baseRadius": 0.46,
-        "midRadius": 0.07,
-        "tipRadius": 0.26,
-        "sides": 24,
-        "lengthScale": 1.0,
-        "rootBone": "trunk_anchor",
-    }
-
-    tusk_options = {
-        "baseRadius": 0.12,
-        "tipRadius": 0.02,
-        "sides": 16,
-        "lengthScale": 1.0,
-    }
+    },
+    "lowPoly": False,
+    "lowPolySegments": 9,
+    "lowPolyWeldTolerance": 0.02,
+}
+
+_NECK_OPTIONS = {
+    "radii": [0.95, 0.38],
+    "sides": 18,
+    "capBase": True,
+    "capEnd": True,
+}
+
+_HEAD_OPTIONS = {
+    "parentBone": "head",
+    "radius": 0.95,
+    "sides": 22,
+    "elongation": 1.0,
+}
+
+_TRUNK_OPTIONS = {
+    "baseRadius": 0.46,
+    "midRadius": 0.07,
+    "tipRadius": 0.26,
+    "sides": 24,
+    "lengthScale": 1.0,
+    "rootBone": "trunk_anchor",
+}
+
+_TUSK_OPTIONS = {
+    "baseRadius": 0.12,
+    "tipRadius": 0.02,
+    "sides": 16,
+    "lengthScale": 1.0,
+}
+
+_EAR_BASE = {
+    "radii": [0.65, 0.35],
+    "sides": 20,
+    "flatten": 0.18,
+}
+
+
+_EAR_LEFT_OPTIONS = {**_EAR_BASE, "tilt": 0.7853981633974483}
+_EAR_RIGHT_OPTIONS = {**_EAR_BASE, "tilt": -0.7853981633974483}
+
+_TAIL_OPTIONS = {"baseRadius": 0.15, "tipRadius": 0.05, "sides": 14}
+
+_FRONT_LEG_OPTIONS = {
+    "radii": [0.5, 0.45, 0.4, 0.38, 0.43],
+    "sides": 20,
+}
+
+_BACK_LEG_OPTIONS = {
+    "radii": [0.55, 0.5, 0.42, 0.38, 0.44],
+    "sides": 20,
+}
+
+# (part name, generator, options) in the order parts appear in the output.
+_PART_SPECS = (
+    ("torso", "torso", _TORSO_OPTIONS),
+    ("neck", "neck", _NECK_OPTIONS),
+    ("head", "head", _HEAD_OPTIONS),
+    ("trunk", "nose", _TRUNK_OPTIONS),
+    ("tail", "tail", _TAIL_OPTIONS),
+    ("earLeft", "ear", _EAR_LEFT_OPTIONS),
+    ("earRight", "ear", _EAR_RIGHT_OPTIONS),
+    ("frontLegL", "limb", _FRONT_LEG_OPTIONS),
+    ("frontLegR", "limb", _FRONT_LEG_OPTIONS),
+    ("backLegL", "limb", _BACK_LEG_OPTIONS),
+    ("backLegR", "limb", _BACK_LEG_OPTIONS),
+    ("tuskLeft", "nose", _TUSK_OPTIONS),
+    ("tuskRight", "nose", _TUSK_OPTIONS),
+)
 
-    ear_base = {
-        "radii": [0.65, 0.35],
-        "sides": 20,
-        "flatten": 0.18,
-    }
 
+def build_elephant_options():
     return {
-        "torso": {"generator": "torso", "options": torso_options},
-        "neck": {"generator": "neck", "options": neck_options},
-        "head": {"generator": "head", "options": head_options},
-        "trunk": {"generator": "nose", "options": trunk_options},
-        "tail": {
-            "generator": "tail",
-            "options": {"baseRadius": 0.15, "tipRadius": 0.05, "sides": 14},
-        },
-        "earLeft": {
-            "generator": "ear",
-            "options": {**ear_base, "tilt": 0.7853981633974483},
-        },
-        "earRight": {
-            "generator": "ear",
-            "options": {**ear_base, "tilt": -0.7853981633974483},
-        },
-        "frontLegL": {
-            "generator": "limb",
-            "options": {
-                "radii": [0.5, 0.45, 0.4, 0.38, 0.43],
-                "sides": 20,
-            },
-        },
-        "frontLegR": {
-            "generator": "limb",
-            "options": {
-                "radii": [0.5, 0.45, 0.4, 0.38, 0.43],
-                "sides": 20,
-            },
-        },
-        "backLegL": {
-            "generator": "limb",
-            "options": {
-                "radii": [0.55, 0.5, 0.42, 0.38, 0.44],
-                "sides": 20,
-            },
-        },
-        "backLegR": {
-            "generator": "limb",
-            "options": {
-                "radii": [0.55, 0.5, 0.42, 0.38, 0.44],
-                "sides": 20,
-            },
-        },
-        "tuskLeft": {"generator": "nose", "options": tusk_options},
-        "tuskRight": {"generator": "nose", "options": tusk_options},
+        name: {"generator": generator, "options": options}
+        for name, generator, options in _PART_SPECS
     }
 
 
 def upgrade_blueprint(input_path: Path, output_path: Path) -> None:
-    blueprint = json.loads(input_path.read_text())
+    blueprint = _loads(input_path.read_bytes())
     blueprint.setdefault("meta", {})["schemaVersion"] = SCHEMA_VERSION
 
     part_options = build_elephant_options()
     body_parts = blueprint.setdefault("bodyParts", {})
 
     for part_name, config in part_options.items():
-        if part_name not in body_parts:
+        # config holds exactly "generator" and "options", so one update()
+        # replaces both on an existing part without re-looking it up.
+        existing = body_parts.get(part_name)
+        if existing is None:
             body_parts[part_name] = {"chain": part_name, **config}
         else:
-            body_parts[part_name]["generator"] = config["generator"]
-            body_parts[part_name]["options"] = config["options"]
+            existing.update(config)
 
-    output_path.write_text(json.dumps(blueprint, indent=2))
+    _atomic_write_bytes(output_path, _dumps(blueprint))
 
 
 def main():
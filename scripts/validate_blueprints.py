@@ -16,10 +16,18 @@ Exits with code 1 if any blueprint fails validation.
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
+import mmap
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import orjson
+from pydantic import TypeAdapter
 
 ROOT = Path(__file__).resolve().parent.parent
 BACKEND_PATH = ROOT / "backend"
@@ -30,8 +38,11 @@ try:
 except Exception as exc:  # pragma: no cover - defensive import guard
     raise SystemExit(f"Failed to import SpeciesBlueprint: {exc}")
 
+# Built once at import time and shared by every file that gets validated.
+_BLUEPRINT_ADAPTER: TypeAdapter[SpeciesBlueprint] = TypeAdapter(SpeciesBlueprint)
+
 
-KNOWN_GENERATORS = {
+KNOWN_GENERATORS = frozenset({
     "torso",
     "neck",
     "head",
@@ -40,44 +51,79 @@ KNOWN_GENERATORS = {
     "trunk",
     "limb",
     "ear",
-}
+})
 
-KNOWN_BEHAVIORS = {
+KNOWN_BEHAVIORS = frozenset({
     "elephant_default",
     "quadruped_walk",
     "none",
-}
-
-
-class ValidationError:
-    def __init__(self, message: str):
-        self.message = message
-
-    def __str__(self) -> str:  # pragma: no cover - trivial
-        return self.message
+})
+
+# Sorted once for the "unknown gait" error message.
+_KNOWN_BEHAVIORS_SORTED = sorted(KNOWN_BEHAVIORS)
+
+# Files at least this large are parsed from a memory map instead of being
+# read into a bytes copy first; below it the mapping overhead dominates.
+MMAP_THRESHOLD = 64 * 1024
+
+# Scalar body-part options that must be non-negative numbers.
+_NON_NEGATIVE_OPTIONS = frozenset({
+    "radius",
+    "radiusTop",
+    "radiusBottom",
+    "baseRadius",
+    "midRadius",
+    "tipRadius",
+    "flatten",
+    "yOffset",
+    "rumpBulgeDepth",
+    "extraMargin",
+    "lengthScale",
+    "lowPolyWeldTolerance",
+})
 
 
 class BlueprintValidationResult:
+    __slots__ = ("path", "errors")
+
     def __init__(self, path: Path):
         self.path = path
-        self.errors: List[ValidationError] = []
+        self.errors: List[str] = []
 
     @property
     def ok(self) -> bool:
         return len(self.errors) == 0
 
     def add(self, message: str) -> None:
-        self.errors.append(ValidationError(message))
+        self.errors.append(message)
 
 
-def _load_blueprint(path: Path) -> Tuple[Dict, SpeciesBlueprint | None]:
-    try:
-        data = json.loads(path.read_text())
-    except Exception:
-        return {}, None
+_LOAD_FAILED = "Pydantic validation failed; see schema for details"
+
+# Error messages keyed by a digest of the file contents, so identical copies
+# of a blueprint (templates, test fixtures) are only parsed and checked once.
+_RESULT_CACHE: Dict[bytes, Tuple[str, ...]] = {}
+
+
+@contextmanager
+def _read_payload(path: Path, size: int) -> Iterator[bytes | memoryview]:
+    """Yield the contents of *path*, memory-mapped when the file is large."""
+    if size < MMAP_THRESHOLD:
+        yield path.read_bytes()
+        return
+    with open(path, "rb") as src, mmap.mmap(
+        src.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped, memoryview(mapped) as view:
+        yield view
+
+
+def _load_blueprint(payload: bytes | memoryview) -> Tuple[Dict, SpeciesBlueprint | None]:
+    # orjson is a backend dependency; it decodes UTF-8 and parses the bytes
+    # in one pass. Malformed JSON raises orjson.JSONDecodeError to the caller.
+    data = orjson.loads(payload)
 
     try:
-        blueprint = SpeciesBlueprint.model_validate(data)
+        blueprint = _BLUEPRINT_ADAPTER.validate_python(data)
     except Exception:
         return data, None
 
@@ -87,13 +133,23 @@ def _load_blueprint(path: Path) -> Tuple[Dict, SpeciesBlueprint | None]:
 def _validate_chain_bones(result: BlueprintValidationResult, blueprint: Dict) -> None:
     skeleton = blueprint.get("skeleton", {})
     bones = skeleton.get("bones", []) or []
-    bone_names = {b.get("name") for b in bones if isinstance(b, dict)}
+    try:
+        # Bones already passed model validation, so they are normally all
+        # dicts; mapping the unbound dict.get keeps the whole loop in C.
+        bone_names = set(map(dict.get, bones, repeat("name")))
+    except TypeError:
+        bone_names = {b.get("name") for b in bones if isinstance(b, dict)}
     chains = blueprint.get("chains", {}) or {}
+    _check_chain_entries(result, chains, bone_names)
 
+
+def _check_chain_entries(
+    result: BlueprintValidationResult, chains: Dict, bone_names: set
+) -> None:
+    # bone_names is built once by the caller and shared with extraChains.
     for chain_name, entries in chains.items():
         if chain_name == "extraChains" and isinstance(entries, dict):
-            for extra_name, extra_entries in entries.items():
-                _validate_chain_bones(result, {"skeleton": skeleton, "chains": {extra_name: extra_entries}})
+            _check_chain_entries(result, entries, bone_names)
             continue
         if not isinstance(entries, list):
             result.add(f"Chain '{chain_name}' must be a list of bone names")
@@ -113,10 +169,19 @@ def _validate_body_parts(result: BlueprintValidationResult, blueprint: Dict) ->
     body_parts = blueprint.get("bodyParts", {}) or {}
     isolate = blueprint.get("debug", {}).get("isolatePart")  # unused but reserved
 
+    _check_body_part_entries(result, body_parts, chain_names)
+
+    if isolate and isolate not in body_parts:
+        result.add(f"debug.isolatePart references unknown body part '{isolate}'")
+
+
+def _check_body_part_entries(
+    result: BlueprintValidationResult, body_parts: Dict, chain_names: set
+) -> None:
+    # chain_names is built once by the caller and shared with extraParts.
     for part_name, part_def in body_parts.items():
         if part_name == "extraParts" and isinstance(part_def, dict):
-            for extra_name, extra_def in part_def.items():
-                _validate_body_parts(result, {"chains": chains, "bodyParts": {extra_name: extra_def}})
+            _check_body_part_entries(result, part_def, chain_names)
             continue
         if not isinstance(part_def, dict):
             result.add(f"Body part '{part_name}' must be an object")
@@ -141,8 +206,15 @@ def _validate_body_parts(result: BlueprintValidationResult, blueprint: Dict) ->
 
         _validate_numeric_options(result, part_name, part_def.get("options", {}))
 
-    if isolate and isolate not in body_parts:
-        result.add(f"debug.isolatePart references unknown body part '{isolate}'")
+
+def _is_non_negative_number(value: object) -> bool:
+    """Return True for an int/float >= 0.
+
+    Exact type checks keep booleans (an ``int`` subclass) out. NaN and
+    infinity need no handling: orjson rejects them while parsing.
+    """
+    kind = type(value)
+    return (kind is int or kind is float) and value >= 0
 
 
 def _validate_numeric_options(result: BlueprintValidationResult, part_name: str, options: Dict) -> None:
@@ -151,7 +223,7 @@ def _validate_numeric_options(result: BlueprintValidationResult, part_name: str,
 
     def ensure_positive_list(name: str, values: Iterable) -> None:
         for idx, val in enumerate(values):
-            if isinstance(val, (int, float)) and val >= 0:
+            if _is_non_negative_number(val):
                 continue
             result.add(
                 f"Body part '{part_name}' option '{name}' index {idx} must be a non-negative number"
@@ -160,23 +232,11 @@ def _validate_numeric_options(result: BlueprintValidationResult, part_name: str,
     if "radii" in options and isinstance(options["radii"], list):
         ensure_positive_list("radii", options["radii"])
 
-    for field in [
-        "radius",
-        "radiusTop",
-        "radiusBottom",
-        "baseRadius",
-        "midRadius",
-        "tipRadius",
-        "flatten",
-        "yOffset",
-        "rumpBulgeDepth",
-        "extraMargin",
-        "lengthScale",
-        "lowPolyWeldTolerance",
-    ]:
-        if field in options:
-            value = options[field]
-            if not isinstance(value, (int, float)) or value < 0:
+    # Walk the options the part actually sets (usually a handful) rather than
+    # probing the dict once per known field; errors follow the file's order.
+    for field, value in options.items():
+        if field in _NON_NEGATIVE_OPTIONS:
+            if not _is_non_negative_number(value):
                 result.add(
                     f"Body part '{part_name}' option '{field}' must be a non-negative number"
                 )
@@ -192,29 +252,52 @@ def _validate_behaviors(result: BlueprintValidationResult, blueprint: Dict) -> N
     gait = behavior.get("gait") or "none"
     if gait not in KNOWN_BEHAVIORS:
         result.add(
-            f"Behavior gait '{gait}' is not in the behavior registry ({sorted(KNOWN_BEHAVIORS)})"
+            f"Behavior gait '{gait}' is not in the behavior registry ({_KNOWN_BEHAVIORS_SORTED})"
         )
 
 
 def validate_blueprint(path: Path) -> BlueprintValidationResult:
     result = BlueprintValidationResult(path)
-    raw, model = _load_blueprint(path)
+    try:
+        # Files of any size are fully validated; large ones are memory-mapped
+        # by _read_payload rather than copied into memory.
+        size = path.stat().st_size
+        with _read_payload(path, size) as payload:
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            messages = _RESULT_CACHE.get(digest)
+            if messages is None:
+                messages = _RESULT_CACHE[digest] = _collect_errors(path, payload)
+    except OSError as exc:
+        # Reported for this file only; the rest of the run carries on.
+        messages = (f"Could not read blueprint file: {exc}",)
+
+    for message in messages:
+        result.add(message)
+    return result
+
 
+def _collect_errors(path: Path, payload: bytes | memoryview) -> Tuple[str, ...]:
+    try:
+        raw, model = _load_blueprint(payload)
+    except orjson.JSONDecodeError as exc:
+        return (f"Invalid JSON: {exc}",)
     if model is None:
-        result.add("Pydantic validation failed; see schema for details")
-        return result
+        return (_LOAD_FAILED,)
 
+    result = BlueprintValidationResult(path)
     _validate_chain_bones(result, raw)
     _validate_body_parts(result, raw)
     _validate_behaviors(result, raw)
-
-    return result
+    return tuple(result.errors)
 
 
 def iter_blueprint_files(directory: Path) -> Iterable[Path]:
-    for path in directory.glob("*.json"):
-        if path.is_file():
-            yield path
+    # DirEntry.is_file() answers from the cached directory entry type, so
+    # only symlinks cost an extra stat (they are still followed, as before).
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                yield Path(entry.path)
 
 
 def main() -> int:
@@ -225,6 +308,20 @@ def main() -> int:
         default=ROOT / "shared" / "blueprints",
         help="Directory containing blueprint JSON files",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes used to validate files "
+            "(default: %(default)s, i.e. validate serially)"
+        ),
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first blueprint that fails validation",
+    )
     args = parser.parse_args()
 
     directory = args.dir
@@ -232,17 +329,36 @@ def main() -> int:
         print(f"Blueprint directory does not exist: {directory}")
         return 1
 
+    paths = sorted(iter_blueprint_files(directory))
+    pool = None
+    if args.jobs > 1:
+        # Each worker has to import the backend models first (~0.1s), which
+        # costs more than validating the dozen bundled blueprints (a few ms),
+        # so the pool is only worth it for large directories.
+        pool = ProcessPoolExecutor(max_workers=args.jobs)
+        results = pool.map(validate_blueprint, paths, chunksize=4)
+    else:
+        # Lazy, so --fail-fast skips the files after the first failure.
+        results = map(validate_blueprint, paths)
+
     failures = 0
-    for path in sorted(iter_blueprint_files(directory)):
-        result = validate_blueprint(path)
-        if result.ok:
-            print(f"[OK] {path}")
-            continue
+    try:
+        for result in results:
+            path = result.path
+            if result.ok:
+                print(f"[OK] {path}")
+                continue
 
-        failures += 1
-        print(f"[FAIL] {path}")
-        for err in result.errors:
-            print(f"  - {err}")
+            failures += 1
+            print(f"[FAIL] {path}")
+            for err in result.errors:
+                print(f"  - {err}")
+            if args.fail_fast:
+                break
+    finally:
+        if pool is not None:
+            # Drop chunks that have not started yet when stopping early.
+            pool.shutdown(cancel_futures=True)
 
     if failures:
         print(f"Validation failed for {failures} blueprint(s)")